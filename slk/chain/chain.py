@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import itertools
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from typing import Any, Dict, List, Optional, Set, Union, cast
 
+from xrpl import XRPLException
 from xrpl.models import (
     XRP,
     AccountInfo,
@@ -16,6 +20,8 @@ from xrpl.models import (
     Request,
     Transaction,
 )
+from xrpl.transaction import XRPLReliableSubmissionException
+from xrpl.wallet import Wallet
 
 from slk.chain.asset_aliases import AssetAliases
 from slk.chain.key_manager import KeyManager
@@ -30,6 +36,17 @@ ROOT_ACCOUNT = Account(
 )
 
 
+# Whether a reliable submission failed in a way that a stale sequence number can
+# cause: the sequence number was already used (tefPAST_SEQ), or it was ahead of the
+# account's, so the transaction was held until its LastLedgerSequence expired. The
+# messages are the ones raised by `ExternalNode.sign_and_submit`.
+def _is_stale_sequence_failure(e: XRPLReliableSubmissionException) -> bool:
+    message = str(e)
+    return message.startswith("tefPAST_SEQ") or message.startswith(
+        "The latest ledger sequence"
+    )
+
+
 class Chain(ABC):
     """Representation of one chain (e.g. mainchain/sidechain)."""
 
@@ -47,6 +64,14 @@ class Chain(ABC):
         self._node = node
         self.key_manager = KeyManager()
         self.asset_aliases = AssetAliases()
+        # request models are immutable, so they can be built once per account and
+        # reused for every lookup
+        self._account_info_requests: Dict[str, AccountInfo] = {}
+        self._account_lines_requests: Dict[str, AccountLines] = {}
+        # account ID -> next sequence number, for accounts that have submitted
+        # transactions through this chain. This is kept per chain rather than per node,
+        # since a chain may submit through different nodes over time.
+        self._next_sequence: Dict[str, int] = {}
 
         if add_root:
             self.key_manager.add(ROOT_ACCOUNT)
@@ -136,12 +161,16 @@ class Chain(ABC):
 
     # rippled stuff
 
-    def send_signed(self: Chain, txn: Transaction) -> Dict[str, Any]:
+    def send_signed(
+        self: Chain, txn: Transaction, *, wait: bool = True
+    ) -> Dict[str, Any]:
         """
         Sign and then send the given transaction.
 
         Args:
             txn: The transaction to sign and submit.
+            wait: Whether to wait for the transaction to be validated, on chains where
+                submission waits for validation. The default is True.
 
         Returns:
             The result of the submitted transaction.
@@ -149,10 +178,62 @@ class Chain(ABC):
         Raises:
             ValueError: If the transaction's account is not a known account.
         """
-        if not self.key_manager.is_account(txn.account):
+        try:
+            account_obj = self.key_manager.get_account(txn.account)
+        except KeyError:
             raise ValueError(f"Account {txn.account} not a known account in chain.")
-        account_obj = self.key_manager.get_account(txn.account)
-        return self.node.sign_and_submit(txn, account_obj.wallet)
+        tracked = self._with_tracked_sequence(txn)
+        if tracked is txn:
+            return self._sign_and_submit(txn, account_obj.wallet, wait)
+        try:
+            result = self._sign_and_submit(tracked, account_obj.wallet, wait)
+            if result.get("engine_result") != "tefPAST_SEQ":
+                return result
+        except XRPLReliableSubmissionException as e:
+            # only a stale sequence number is worth retrying. Other failures (e.g. a
+            # malformed transaction) would just fail again.
+            if not _is_stale_sequence_failure(e):
+                raise
+        # the tracked sequence number may have been stale (e.g. the account also
+        # submitted through another client), so let the node fill in a fresh one and try
+        # once more
+        return self._sign_and_submit(txn, account_obj.wallet, wait)
+
+    def _with_tracked_sequence(self: Chain, txn: Transaction) -> Transaction:
+        # Fill in the transaction's sequence number from the ones tracked by this chain,
+        # so that autofilling the transaction doesn't need to fetch it.
+        if (
+            txn.sequence is None
+            and txn.ticket_sequence is None
+            and txn.account in self._next_sequence
+        ):
+            return replace(txn, sequence=self._next_sequence[txn.account])
+        return txn
+
+    def _sign_and_submit(
+        self: Chain, txn: Transaction, wallet: Wallet, wait: bool
+    ) -> Dict[str, Any]:
+        # Submit the transaction through the chain's current node, and track the
+        # account's next sequence number from the result.
+        try:
+            result = self.node.sign_and_submit(txn, wallet, wait=wait)
+        except XRPLReliableSubmissionException:
+            # the sequence number may not have been consumed, so re-fetch it next time
+            self._next_sequence.pop(txn.account, None)
+            raise
+        if txn.ticket_sequence is not None:
+            return result
+        engine_result = result.get("engine_result", "")
+        if result.get("validated"):
+            # a validated transaction always consumes its sequence number
+            self._next_sequence[txn.account] = result["Sequence"] + 1
+        elif engine_result.startswith(("tes", "tec")) or engine_result == "terQUEUED":
+            # the transaction consumed its sequence number
+            self._next_sequence[txn.account] = result["tx_json"]["Sequence"] + 1
+        else:
+            # the sequence number may not have been consumed, so re-fetch it next time
+            self._next_sequence.pop(txn.account, None)
+        return result
 
     def request(self: Chain, req: Request) -> Dict[str, Any]:
         """
@@ -168,6 +249,16 @@ class Chain(ABC):
 
     # specific rippled methods
 
+    def _account_info_request(self: Chain, account_id: str) -> AccountInfo:
+        if account_id not in self._account_info_requests:
+            self._account_info_requests[account_id] = AccountInfo(account=account_id)
+        return self._account_info_requests[account_id]
+
+    def _account_lines_request(self: Chain, account_id: str) -> AccountLines:
+        if account_id not in self._account_lines_requests:
+            self._account_lines_requests[account_id] = AccountLines(account=account_id)
+        return self._account_lines_requests[account_id]
+
     def maybe_ledger_accept(self: Chain) -> None:
         """Advance the ledger if the chain is in standalone mode."""
         if not self.standalone:
@@ -193,11 +284,15 @@ class Chain(ABC):
         """
         if account is None:
             known_accounts = self.key_manager.known_accounts()
-            return [d for acc in known_accounts for d in self.get_account_info(acc)]
+            with ThreadPoolExecutor() as executor:
+                return list(
+                    itertools.chain.from_iterable(
+                        executor.map(self.get_account_info, known_accounts)
+                    )
+                )
         try:
-            result = self.request(AccountInfo(account=account.account_id))
-        except:
-            # TODO: better error checking
+            result = self.request(self._account_info_request(account.account_id))
+        except XRPLException:
             # Most likely the account does not exist on the ledger. Give a balance of 0.
             return [
                 {
@@ -251,9 +346,18 @@ class Chain(ABC):
         if account is None:
             account = self.key_manager.known_accounts()
         if isinstance(account, list):
-            return [d for acc in account for d in self.get_balances(acc, token)]
+            with ThreadPoolExecutor() as executor:
+                return list(
+                    itertools.chain.from_iterable(
+                        executor.map(lambda acc: self.get_balances(acc, token), account)
+                    )
+                )
         if isinstance(token, list):
-            return [d for ass in token for d in self.get_balances(account, ass)]
+            return list(
+                itertools.chain.from_iterable(
+                    self.get_balances(account, ass) for ass in token
+                )
+            )
         if isinstance(token, XRP):
             try:
                 account_info = self.get_account_info(account)[0]
@@ -264,8 +368,7 @@ class Chain(ABC):
                 }
                 account_info.update({"currency": "XRP", "peer": "", "limit": ""})
                 return [account_info]
-            except:
-                # TODO: better error handling
+            except (XRPLException, KeyError, ValueError):
                 # Most likely the account does not exist on the ledger. Give a balance
                 # of zero.
                 return [
@@ -291,8 +394,7 @@ class Chain(ABC):
                     {k: trustline[k] for k in trustline if k in needed_data}
                     for trustline in trustlines
                 ]
-            except:
-                # TODO: better error handling
+            except (XRPLException, KeyError, ValueError):
                 # Most likely the account does not exist on the ledger. Return an empty
                 # data frame
                 return []
@@ -308,10 +410,10 @@ class Chain(ABC):
         Returns:
             The balance of the token in the account.
         """
+        result = self.get_balances(account, token)
         try:
-            result = self.get_balances(account, token)
             return str(result[0]["balance"])
-        except:
+        except (IndexError, KeyError):
             return "0"
 
     def get_trust_lines(
@@ -332,7 +434,7 @@ class Chain(ABC):
             ValueError: If the account_lines command fails.
         """
         if peer is None:
-            result = self.request(AccountLines(account=account.account_id))
+            result = self.request(self._account_lines_request(account.account_id))
         else:
             result = self.request(
                 AccountLines(account=account.account_id, peer=peer.account_id)
@@ -1,9 +1,13 @@
 """Helper methods for setting up chains."""
 
-from typing import List, Optional
-
-from xrpl.account import does_account_exist, get_account_root
-from xrpl.clients.sync_client import SyncClient
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from xrpl.account import get_account_root, get_next_valid_seq_number
+from xrpl.clients import XRPLRequestFailureException
+from xrpl.ledger import get_fee, get_latest_validated_ledger_sequence
 from xrpl.models import (
     AccountSet,
     AccountSetFlag,
@@ -12,6 +16,7 @@ from xrpl.models import (
     SignerEntry,
     SignerListSet,
     TicketCreate,
+    Transaction,
     TrustSet,
 )
 from xrpl.utils import xrp_to_drops
@@ -20,12 +25,19 @@ from slk.chain.chain import Chain
 from slk.chain.context_managers import connect_to_external_chain
 from slk.classes.account import Account
 
+# The federators identify what each of the door account's tickets is for by the source
+# tag of the TicketCreate that created it, so each ticket needs its own TicketCreate
+# (rather than one TicketCreate with ticket_count=3). They are still submitted together
+# and settle in a single ledger close.
 MAINCHAIN_DOOR_KEEPER = 0
 SIDECHAIN_DOOR_KEEPER = 1
 UPDATE_SIGNER_LIST = 2
 
 _LSF_DISABLE_MASTER = 0x00100000  # 1048576
 
+# how many ledgers a setup transaction stays valid for
+_LEDGER_OFFSET = 20
+
 _GENESIS_ACCOUNT = Account(
     account_id="rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh",
     seed="snoPBrXtMeMyMHUVTgbuqAfg1SUTb",
@@ -33,10 +45,98 @@ _GENESIS_ACCOUNT = Account(
 )
 
 
-def _is_door_master_disabled(door_acct: str, client: SyncClient) -> bool:
-    account_root = get_account_root(door_acct, client)
-    flags = account_root["Flags"]
-    return bool(int(flags) & _LSF_DISABLE_MASTER)
+def _get_account_root(account_id: str, chain: Chain) -> Optional[Dict[str, Any]]:
+    # Fetch the account root of an account, or None if the account doesn't exist. This
+    # replaces separate `does_account_exist` and `get_account_root` calls, which would
+    # each fetch the account root.
+    try:
+        with chain.node.pool.acquire() as client:
+            return get_account_root(account_id, client)
+    except XRPLRequestFailureException as e:
+        if e.error == "actNotFound":
+            return None
+        raise
+
+
+def _is_master_disabled(account_root: Dict[str, Any]) -> bool:
+    return bool(account_root["Flags"] & _LSF_DISABLE_MASTER)
+
+
+@lru_cache(maxsize=4)
+def _signer_list(federators: Tuple[str, ...]) -> Tuple[int, Tuple[SignerEntry, ...]]:
+    # The same federators are used for both chains, so the quorum and the signer
+    # entries only need to be built once. The entries are returned as a tuple, since
+    # every caller shares the cached value.
+    # quorum is 80%
+    divide = 4 * len(federators)
+    by = 5
+    quorum = (divide + by - 1) // by
+    entries = tuple(
+        SignerEntry(account=federator, signer_weight=1) for federator in federators
+    )
+    return quorum, entries
+
+
+def _signer_list_set(account: str, federators: List[str]) -> SignerListSet:
+    quorum, entries = _signer_list(tuple(federators))
+    return SignerListSet(
+        account=account, signer_quorum=quorum, signer_entries=list(entries)
+    )
+
+
+def _door_account_txns(door_acct: str, federators: List[str]) -> List[Transaction]:
+    # The transactions that turn an account into a door account, shared by both
+    # chains: set the signer list, create the federators' tickets, and disable the
+    # master key.
+    return [
+        _signer_list_set(door_acct, federators),
+        TicketCreate(
+            account=door_acct,
+            source_tag=MAINCHAIN_DOOR_KEEPER,
+            ticket_count=1,
+        ),
+        TicketCreate(
+            account=door_acct,
+            source_tag=SIDECHAIN_DOOR_KEEPER,
+            ticket_count=1,
+        ),
+        TicketCreate(
+            account=door_acct,
+            source_tag=UPDATE_SIGNER_LIST,
+            ticket_count=1,
+        ),
+        AccountSet(
+            account=door_acct,
+            set_flag=AccountSetFlag.ASF_DISABLE_MASTER,
+        ),
+    ]
+
+
+def _submit_batch(chain: Chain, txns: List[Transaction]) -> None:
+    # Submit transactions from a single account back-to-back, then close the ledger
+    # once. The sequence numbers, fee, and last ledger sequence are filled in up front,
+    # so the transactions don't need to be autofilled one by one. Only the last
+    # transaction waits to be validated: since the sequence numbers are consecutive,
+    # the earlier ones must have been validated by then.
+    if not txns:
+        return
+    with chain.node.pool.acquire() as client:
+        sequence = get_next_valid_seq_number(txns[0].account, client)
+        fee = get_fee(client)
+        last_ledger_sequence = (
+            get_latest_validated_ledger_sequence(client) + _LEDGER_OFFSET
+        )
+    for i, txn in enumerate(txns):
+        chain.send_signed(
+            replace(
+                txn,
+                sequence=sequence + i,
+                fee=fee,
+                last_ledger_sequence=last_ledger_sequence,
+            ),
+            wait=(i == len(txns) - 1),
+        )
+    chain.maybe_ledger_accept()
 
 
 def setup_mainchain(
@@ -58,24 +158,38 @@ def setup_mainchain(
             cross-chain IOU. Default is None.
 
     Raises:
-        Exception: If the issuer on an external network doesn't exist.
+        Exception: If the door account or the issuer on an external network doesn't
+            exist.
     """
     mc_chain.add_to_keymanager(mc_door_account)
 
     # mc_chain.request(LogLevel('fatal'))
-    # TODO: only do all this setup for external network if it hasn't already been done
 
     if main_standalone:
         issuer: Optional[Account] = _GENESIS_ACCOUNT
     elif issuer_seed is not None:
         issuer = Account.from_seed("issuer", issuer_seed)
         mc_chain.add_to_keymanager(issuer)
-
-        if not does_account_exist(issuer.account_id, mc_chain.node.client):
-            raise Exception(f"Account {issuer} needs to be funded to exist.")
     else:
         issuer = None
 
+    door_acct = mc_door_account.account_id
+
+    # Check whether setup has already been done before sending any transactions, so
+    # that re-running setup against an already-configured network is a no-op
+    door_root = _get_account_root(door_acct, mc_chain)
+    if door_root is None:
+        if not main_standalone:
+            raise Exception(f"Account {door_acct} needs to be funded to exist.")
+    elif _is_master_disabled(door_root):
+        # assumed that setup is already done
+        # TODO: check if the enabled keys are actually from these federators
+        return
+
+    if not main_standalone and issuer is not None:
+        if _get_account_root(issuer.account_id, mc_chain) is None:
+            raise Exception(f"Account {issuer} needs to be funded to exist.")
+
     if issuer is not None:
         # Allow rippling through the IOU issuer account
         mc_chain.send_signed(
@@ -86,8 +200,6 @@ def setup_mainchain(
         )
         mc_chain.maybe_ledger_accept()
 
-    door_acct = mc_door_account.account_id
-
     # Create and fund the mc door account
     if main_standalone:
         mc_chain.send_signed(
@@ -98,20 +210,11 @@ def setup_mainchain(
             )
         )
         mc_chain.maybe_ledger_accept()
-    else:
-        if not does_account_exist(door_acct, mc_chain.node.client):
-            raise Exception(f"Account {door_acct} needs to be funded to exist.")
-
-    if does_account_exist(door_acct, mc_chain.node.client) and _is_door_master_disabled(
-        door_acct, mc_chain.node.client
-    ):
-        # assumed that setup is already done
-        # TODO: check if the enabled keys are actually from these federators
-        return
 
+    txns: List[Transaction] = []
     if issuer is not None:
         # Create a trust line so USD/root account ious can be sent cross chain
-        mc_chain.send_signed(
+        txns.append(
             TrustSet(
                 account=door_acct,
                 limit_amount=IssuedCurrencyAmount(
@@ -122,53 +225,8 @@ def setup_mainchain(
             )
         )
 
-    # set the chain's signer list and disable the master key
-    # quorum is 80%
-    divide = 4 * len(federators)
-    by = 5
-    quorum = (divide + by - 1) // by
-    mc_chain.send_signed(
-        SignerListSet(
-            account=door_acct,
-            signer_quorum=quorum,
-            signer_entries=[
-                SignerEntry(account=federator, signer_weight=1)
-                for federator in federators
-            ],
-        )
-    )
-    mc_chain.maybe_ledger_accept()
-    mc_chain.send_signed(
-        TicketCreate(
-            account=door_acct,
-            source_tag=MAINCHAIN_DOOR_KEEPER,
-            ticket_count=1,
-        )
-    )
-    mc_chain.maybe_ledger_accept()
-    mc_chain.send_signed(
-        TicketCreate(
-            account=door_acct,
-            source_tag=SIDECHAIN_DOOR_KEEPER,
-            ticket_count=1,
-        )
-    )
-    mc_chain.maybe_ledger_accept()
-    mc_chain.send_signed(
-        TicketCreate(
-            account=door_acct,
-            source_tag=UPDATE_SIGNER_LIST,
-            ticket_count=1,
-        )
-    )
-    mc_chain.maybe_ledger_accept()
-    mc_chain.send_signed(
-        AccountSet(
-            account=door_acct,
-            set_flag=AccountSetFlag.ASF_DISABLE_MASTER,
-        )
-    )
-    mc_chain.maybe_ledger_accept()
+    txns += _door_account_txns(door_acct, federators)
+    _submit_batch(mc_chain, txns)
 
 
 def setup_sidechain(
@@ -189,53 +247,9 @@ def setup_sidechain(
     # sc_chain.send_signed(LogLevel('fatal'))
     # sc_chain.send_signed(LogLevel('trace', partition='SidechainFederator'))
 
-    # set the chain's signer list and disable the master key
-    # quorum is 80%
-    divide = 4 * len(federators)
-    by = 5
-    quorum = (divide + by - 1) // by
-    sc_chain.send_signed(
-        SignerListSet(
-            account=_GENESIS_ACCOUNT.account_id,
-            signer_quorum=quorum,
-            signer_entries=[
-                SignerEntry(account=federator, signer_weight=1)
-                for federator in federators
-            ],
-        )
+    _submit_batch(
+        sc_chain, _door_account_txns(_GENESIS_ACCOUNT.account_id, federators)
     )
-    sc_chain.maybe_ledger_accept()
-    sc_chain.send_signed(
-        TicketCreate(
-            account=_GENESIS_ACCOUNT.account_id,
-            source_tag=MAINCHAIN_DOOR_KEEPER,
-            ticket_count=1,
-        )
-    )
-    sc_chain.maybe_ledger_accept()
-    sc_chain.send_signed(
-        TicketCreate(
-            account=_GENESIS_ACCOUNT.account_id,
-            source_tag=SIDECHAIN_DOOR_KEEPER,
-            ticket_count=1,
-        )
-    )
-    sc_chain.maybe_ledger_accept()
-    sc_chain.send_signed(
-        TicketCreate(
-            account=_GENESIS_ACCOUNT.account_id,
-            source_tag=UPDATE_SIGNER_LIST,
-            ticket_count=1,
-        )
-    )
-    sc_chain.maybe_ledger_accept()
-    sc_chain.send_signed(
-        AccountSet(
-            account=_GENESIS_ACCOUNT.account_id,
-            set_flag=AccountSetFlag.ASF_DISABLE_MASTER,
-        )
-    )
-    sc_chain.maybe_ledger_accept()
 
 
 def setup_prod_mainchain(
@@ -288,24 +302,75 @@ def setup_prod_sidechain(
         setup_sidechain(sc_chain, federators, sc_door_account)
 
 
+def setup_prod_chains(
+    mainnet_url: str,
+    mainnet_ws_port: int,
+    sidechain_url: str,
+    sidechain_ws_port: int,
+    federators: List[str],
+    mc_door_account_seed: str,
+    sc_door_account: Account = _GENESIS_ACCOUNT,
+    issuer: Optional[str] = None,
+) -> None:
+    """
+    Set up a production mainchain and sidechain. The two chains are independent, so
+    they are set up concurrently.
+
+    Args:
+        mainnet_url: The URL/IP address of a node on the mainchain.
+        mainnet_ws_port: The WS port of the mainchain node.
+        sidechain_url: The URL/IP address of a node on the sidechain.
+        sidechain_ws_port: The WS port of the sidechain node.
+        federators: A list of the federators' public keys (for multisigning).
+        mc_door_account_seed: The seed of the mainchain door account.
+        sc_door_account: The sidechain door account. The default is the genesis
+            account. This is the default in the sidechain code as well.
+        issuer: The issuer of a cross-chain IOU. If None, there is no cross-chain IOU.
+            Default is None.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        mainchain_setup = executor.submit(
+            setup_prod_mainchain,
+            mainnet_url,
+            mainnet_ws_port,
+            federators,
+            mc_door_account_seed,
+            issuer,
+        )
+        sidechain_setup = executor.submit(
+            setup_prod_sidechain,
+            sidechain_url,
+            sidechain_ws_port,
+            federators,
+            sc_door_account,
+        )
+        mainchain_setup.result()
+        sidechain_setup.result()
+
+
 # def main(
 #     mainnet_url: str,
 #     mainnet_ws_port: int,
 #     sidechain_url: str,
 #     sidechain_ws_port: int,
 #     federators: List[str],
-#     mc_door_account: Account,
+#     mc_door_account_seed: str,
 #     sc_door_account: Account,
 #     issuer: Optional[str] = None,
 # ) -> None:
 #     """
 #     Set up a production
 #     """
-#     setup_prod_mainchain(
-#         mainnet_url, mainnet_ws_port, federators, mc_door_account, issuer
+#     setup_prod_chains(
+#         mainnet_url,
+#         mainnet_ws_port,
+#         sidechain_url,
+#         sidechain_ws_port,
+#         federators,
+#         mc_door_account_seed,
+#         sc_door_account,
+#         issuer,
 #     )
-#     setup_prod_sidechain(sidechain_url, sidechain_ws_port, federators,
-#         sc_door_account)
 
 
 # TODO: set up CLI args
@@ -1,14 +1,31 @@
 """Context managers for working with a chain."""
 
+import atexit
 import os
 from contextlib import contextmanager
-from typing import Generator, List, Optional
+from typing import Dict, Generator, List, Optional, Tuple
 
 from slk.chain.external_chain import ExternalChain
 from slk.chain.mainchain import Mainchain
 from slk.chain.sidechain import Sidechain
 from slk.classes.config_file import ConfigFile
 
+# chains kept running between uses of a context manager with `reuse` set, keyed by the
+# rippled executable and the config file location(s)
+_MAINCHAIN_CACHE: Dict[Tuple[str, str], Mainchain] = {}
+_SIDECHAIN_CACHE: Dict[Tuple[str, Tuple[str, ...]], Sidechain] = {}
+
+
+# shut down the chains that were kept running for reuse
+def _shutdown_cached_chains() -> None:
+    for cache in (_MAINCHAIN_CACHE, _SIDECHAIN_CACHE):
+        for chain in cache.values():
+            chain.shutdown()
+        cache.clear()
+
+
+atexit.register(_shutdown_cached_chains)
+
 
 # Start a chain with a single node
 @contextmanager
@@ -19,6 +36,7 @@ def single_node_chain(
     server_out: str = os.devnull,
     run_server: bool = True,
     exe: str,
+    reuse: bool = False,
 ) -> Generator[Mainchain, None, None]:
     """
     Start a rippled server and return a chain.
@@ -29,23 +47,35 @@ def single_node_chain(
         server_out: The location to output stdout to. The default is os.devnull.
         run_server: Whether to start the server. The default is True.
         exe: The file location of the rippled executable.
+        reuse: Whether to keep the chain running when the context exits, so that the
+            next use with the same executable and config gets the same chain instead
+            of starting a new server. The chain is shut down if the context exits with
+            an error, and otherwise when the program exits. The default is False.
 
     Yields:
         A standalone single-node chain.
     """
-    chain = None
+    key = (exe, config.get_file_name())
+    # take the chain out of the cache while it's in use, so it isn't handed out twice
+    chain = _MAINCHAIN_CACHE.pop(key, None) if reuse else None
+    keep = False
     try:
-        chain = Mainchain(
-            exe,
-            config=config,
-            command_log=command_log,
-            run_server=run_server,
-            server_out=server_out,
-        )
+        if chain is None:
+            chain = Mainchain(
+                exe,
+                config=config,
+                command_log=command_log,
+                run_server=run_server,
+                server_out=server_out,
+            )
         yield chain
+        keep = reuse
     finally:
         if chain:
-            chain.shutdown()
+            if keep:
+                _MAINCHAIN_CACHE[key] = chain
+            else:
+                chain.shutdown()
 
 
 @contextmanager
@@ -83,6 +113,7 @@ def sidechain_network(
     configs: List[ConfigFile],
     command_logs: Optional[List[Optional[str]]] = None,
     run_server: Optional[List[bool]] = None,
+    reuse: bool = False,
 ) -> Generator[Sidechain, None, None]:
     """
     Start an XRPL testnet and return a chain.
@@ -92,20 +123,33 @@ def sidechain_network(
         configs: The config files to use for rippled.
         command_logs: The log files. Optional.
         run_server: Whether to start the server. Optional.
+        reuse: Whether to keep the network running when the context exits, so that
+            the next use with the same executable and configs gets the same chain
+            instead of starting new servers. The chain is shut down if the context
+            exits with an error, and otherwise when the program exits. The default is
+            False.
 
     Yields:
         A locally-running sidechain.
     """
-    chain = None
+    key = (exe, tuple(config.get_file_name() for config in configs))
+    # take the chain out of the cache while it's in use, so it isn't handed out twice
+    chain = _SIDECHAIN_CACHE.pop(key, None) if reuse else None
+    keep = False
     try:
-        chain = Sidechain(
-            exe,
-            configs=configs,
-            command_logs=command_logs,
-            run_server=run_server,
-        )
-        chain.wait_for_validated_ledger()
+        if chain is None:
+            chain = Sidechain(
+                exe,
+                configs=configs,
+                command_logs=command_logs,
+                run_server=run_server,
+            )
+            chain.wait_for_validated_ledger()
         yield chain
+        keep = reuse
     finally:
         if chain:
-            chain.shutdown()
+            if keep:
+                _SIDECHAIN_CACHE[key] = chain
+            else:
+                chain.shutdown()
@@ -27,7 +27,10 @@ class ExternalChain(Chain):
             port: The WS public port of the node.
         """
         super().__init__(ExternalNode("ws", url, port), add_root=False)
-        self.node.client.open()
+        # connect right away, so that an unreachable node is reported here rather than
+        # on the first request
+        with self.node.pool.acquire():
+            pass
 
     @property
     def standalone(self: ExternalChain) -> bool:
@@ -6,22 +6,35 @@ network connection.
 from __future__ import annotations
 
 import os
+import time
 from typing import Any, Dict, List, Optional
 
-from xrpl.clients import WebsocketClient
-from xrpl.models import Transaction
+from xrpl.clients import XRPLRequestFailureException
+from xrpl.ledger import get_latest_validated_ledger_sequence
+from xrpl.models import Transaction, Tx
 from xrpl.transaction import (
+    XRPLReliableSubmissionException,
     safe_sign_and_autofill_transaction,
-    send_reliable_submission,
+    safe_sign_transaction,
+    submit_transaction,
 )
 from xrpl.wallet import Wallet
 
 from slk.chain.node import Node
+from slk.chain.node_pool import NodePool
+
+# How often to check whether a submitted transaction has been validated (in seconds).
+# xrpl-py's `send_reliable_submission` waits 4 seconds between checks, which is a full
+# ledger close even when the transaction was validated almost immediately.
+_SUBMISSION_POLL_INTERVAL = 1
 
 
 class ExternalNode(Node):
     """Client to send commands to the rippled server"""
 
+    # an external node only uses the connection-related attributes of `Node`
+    __slots__ = ()
+
     def __init__(
         self: ExternalNode,
         protocol: str,
@@ -40,8 +53,20 @@ class ExternalNode(Node):
         self.websocket_uri = f"{protocol}://{ip}:{port}"
         self.ip = ip
         self.port = port
-        self.client = WebsocketClient(url=self.websocket_uri)
+        # connections to an external node are shared with every other chain connected
+        # to the same node (see `NodePool.shared`)
+        self.pool = NodePool.shared(self.websocket_uri)
         self.name = self.websocket_uri
+        self._cached_info: Optional[Dict[str, Any]] = None
+        self._cached_info_time = 0.0
+
+    def shutdown(self: ExternalNode) -> None:
+        """
+        Stop using the connections to the server. The connections are shared with
+        other chains connected to the same node, so they stay open for reuse until the
+        program exits.
+        """
+        self._cached_info = None
 
     @property
     def config_file_name(self: ExternalNode) -> str:
@@ -73,7 +98,7 @@ class ExternalNode(Node):
         return True
 
     def sign_and_submit(
-        self: ExternalNode, txn: Transaction, wallet: Wallet
+        self: ExternalNode, txn: Transaction, wallet: Wallet, *, wait: bool = True
     ) -> Dict[str, Any]:
         """
         Sign and submit the given transaction.
@@ -81,12 +106,68 @@ class ExternalNode(Node):
         Args:
             txn: The transaction to send.
             wallet: The wallet to be used to sign the transaction.
+            wait: Whether to wait for the transaction to be validated. The default is
+                True. If False, this returns the preliminary result of the submission.
 
         Returns:
             The result from the server for the transaction's submission.
         """
-        autofilled = safe_sign_and_autofill_transaction(txn, wallet, self.client)
-        return send_reliable_submission(autofilled, self.client).result
+        if not wait:
+            return super().sign_and_submit(txn, wallet)
+        if self._is_filled(txn):
+            autofilled = safe_sign_transaction(txn, wallet, check_fee=False)
+        else:
+            with self.pool.acquire() as client:
+                autofilled = safe_sign_and_autofill_transaction(txn, wallet, client)
+        return self._send_reliable_submission(autofilled)
+
+    def _send_reliable_submission(
+        self: ExternalNode, txn: Transaction
+    ) -> Dict[str, Any]:
+        """
+        Submit a signed transaction and wait for it to be validated. This is the same as
+        `xrpl.transaction.send_reliable_submission`, but it checks for the outcome more
+        often.
+
+        Args:
+            txn: The signed and autofilled transaction to submit.
+
+        Returns:
+            The result of the validated transaction.
+
+        Raises:
+            XRPLReliableSubmissionException: If the transaction is malformed, its
+                sequence number has already been used, or it expires before being
+                validated.
+            XRPLRequestFailureException: If looking up the transaction fails.
+        """
+        assert txn.last_ledger_sequence is not None  # set by autofill
+        txn_hash = txn.get_hash()
+        with self.pool.acquire() as client:
+            submit_result = submit_transaction(txn, client).result
+            prelim_result = submit_result["engine_result"]
+            # neither of these can ever be validated, so don't wait for the
+            # transaction to expire
+            if prelim_result.startswith("tem") or prelim_result == "tefPAST_SEQ":
+                raise XRPLReliableSubmissionException(
+                    f"{prelim_result}: {submit_result['engine_result_message']}"
+                )
+
+            while True:
+                time.sleep(_SUBMISSION_POLL_INTERVAL)
+                response = client.request(Tx(transaction=txn_hash))
+                if response.is_successful():
+                    if response.result.get("validated"):
+                        return response.result
+                elif response.result.get("error") != "txnNotFound":
+                    raise XRPLRequestFailureException(response.result)
+                latest_ledger = get_latest_validated_ledger_sequence(client)
+                if latest_ledger >= txn.last_ledger_sequence:
+                    raise XRPLReliableSubmissionException(
+                        f"The latest ledger sequence {latest_ledger} is greater than "
+                        f"the last ledger sequence {txn.last_ledger_sequence} in the "
+                        "transaction."
+                    )
 
     def start_server(
         self: ExternalNode,
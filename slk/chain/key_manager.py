@@ -16,6 +16,8 @@ class KeyManager:
         """Initialize a KeyManager."""
         self._aliases: Dict[str, Account] = {}  # alias -> account
         self._accounts: Dict[str, Account] = {}  # account id -> account
+        # cached result of `known_accounts`, reset whenever an account is added
+        self._known_accounts: Optional[List[Account]] = None
 
     def add(self: KeyManager, account: Account) -> None:
         """
@@ -26,6 +28,7 @@ class KeyManager:
         """
         self._aliases[account.nickname] = account
         self._accounts[account.account_id] = account
+        self._known_accounts = None
 
     def is_alias(self: KeyManager, name: str) -> bool:
         """
@@ -60,18 +63,23 @@ class KeyManager:
 
         Returns:
             The Account that maps to the provided name.
+
+        Raises:
+            KeyError: If the name is not a known alias.
         """
-        assert name in self._aliases
         return self._aliases[name]
 
     def known_accounts(self: KeyManager) -> List[Account]:
         """
-        Return a list of all known accounts.
+        Return a list of all known accounts. The list is shared between calls, so it
+        must not be modified.
 
         Returns:
             A list of all known accounts.
         """
-        return list(self._accounts.values())
+        if self._known_accounts is None:
+            self._known_accounts = list(self._accounts.values())
+        return self._known_accounts
 
     def get_account(self: KeyManager, account: str) -> Account:
         """
@@ -99,8 +107,9 @@ class KeyManager:
         if isinstance(account_id, Account):
             return account_id.nickname
 
-        if account_id in self._accounts:
-            return self._accounts[account_id].nickname
+        account = self._accounts.get(account_id)
+        if account is not None:
+            return account.nickname
         return account_id
 
     def alias_to_account_id(self: KeyManager, alias: str) -> Optional[str]:
@@ -113,8 +122,9 @@ class KeyManager:
         Returns:
             An account ID, if the alias exists. If not, returns None.
         """
-        if alias in self._aliases:
-            return self._aliases[alias].account_id
+        account = self._aliases.get(alias)
+        if account is not None:
+            return account.account_id
         return None
 
     def to_string(self: KeyManager, nickname: Optional[str] = None) -> str:
@@ -128,28 +138,16 @@ class KeyManager:
             The string form of the key manager.
         """
         # TODO: use alias_to_account_id instead of to_string(nickname)
-        data = []
         if nickname is not None:
             if nickname in self._aliases:
                 account_id = self._aliases[nickname].account_id
             else:
                 account_id = "NA"
-            data.append(
-                {
-                    "name": nickname,
-                    "address": account_id,
-                }
-            )
+            data = [(nickname, account_id)]
         else:
-            for (k, v) in self._aliases.items():
-                data.append(
-                    {
-                        "name": k,
-                        "address": v.account_id,
-                    }
-                )
+            data = [(k, v.account_id) for (k, v) in self._aliases.items()]
         return tabulate(
             data,
-            headers="keys",
+            headers=("name", "address"),
             tablefmt="presto",
         )
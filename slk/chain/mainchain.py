@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import os
-import time
 from typing import Any, Dict, List, Optional, Set, Union
 
 from xrpl.models import GenericRequest
@@ -44,8 +43,6 @@ class Mainchain(Chain):
         if run_server:
             self.servers_start(server_out=server_out)
 
-        self.node.client.open()
-
     @property
     def standalone(self: Mainchain) -> bool:
         """
@@ -106,8 +103,9 @@ class Mainchain(Chain):
 
     def shutdown(self: Mainchain) -> None:
         """Shut down the chain."""
-        self.node.shutdown()
+        # stop the server first, since stopping it uses the node's connections
         self.servers_stop()
+        self.node.shutdown()
 
     def servers_start(
         self: Mainchain,
@@ -134,14 +132,7 @@ class Mainchain(Chain):
 
         self.node.start_server(standalone=True, server_out=server_out)
         self.server_running = True
-
-        # wait until the server has started up
-        counter = 0
-        while not self.node.server_started():
-            counter += 1
-            if counter == 20:  # 10 second timeout
-                raise Exception("Timeout: server took too long to start.")
-            time.sleep(0.5)
+        self.node.wait_for_server_start()
 
     def servers_stop(
         self: Mainchain, server_indexes: Optional[Union[Set[int], List[int]]] = None
@@ -6,19 +6,62 @@ import os
 import socket
 import subprocess
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from xrpl.clients import WebsocketClient
-from xrpl.models import Request, ServerInfo, Transaction
+from xrpl import XRPLException
+from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
+from xrpl.clients import XRPLRequestFailureException
+from xrpl.models import GenericRequest, Request, ServerInfo, Transaction
 from xrpl.transaction import safe_sign_and_submit_transaction
 from xrpl.wallet import Wallet
 
+from slk.chain.node_pool import NodePool
 from slk.classes.config_file import ConfigFile
 
+# how long to wait for a server's WS port to start accepting connections, in seconds
+SERVER_START_TIMEOUT = 10.0
+# bounds on the delay between checks of whether a server has started, in seconds
+_SERVER_START_MIN_POLL = 0.005
+_SERVER_START_MAX_POLL = 0.1
+# how long to wait for a server to exit after asking it to stop, in seconds
+_SERVER_STOP_TIMEOUT = 30.0
+# how long to wait for a server to reach each stage of syncing, in seconds
+_SYNC_TIMEOUT = 600.0
+# the delay between server info polls while syncing starts at `_SYNC_MIN_POLL` and
+# grows by `_SYNC_POLL_BACKOFF` after each poll, up to `_SYNC_MAX_POLL` (in seconds)
+_SYNC_MIN_POLL = 0.1
+_SYNC_MAX_POLL = 2.0
+_SYNC_POLL_BACKOFF = 1.5
+# server states that mean a server is synced with the network ("full" for tracking
+# servers, "proposing" for validators)
+_SYNCED_STATES = ("full", "proposing")
+# how often to print progress while waiting for a server to sync, in seconds
+_SYNC_REPORT_INTERVAL = 10.0
+# how long a node's server info is reused by `get_brief_server_info`, in seconds. This
+# is well under the ~4 second ledger close interval, so the info is never more than a
+# ledger behind.
+SERVER_INFO_TTL = 1.0
+
 
 class Node:
     """Represents one node in a chain and its network connection."""
 
+    __slots__ = (
+        "websocket_uri",
+        "ip",
+        "port",
+        "_sockaddr",
+        "name",
+        "pool",
+        "config",
+        "exe",
+        "command_log",
+        "pid",
+        "process",
+        "_cached_info",
+        "_cached_info_time",
+    )
+
     def __init__(
         self: Node,
         *,
@@ -40,13 +83,24 @@ class Node:
         self.websocket_uri = f"{section.protocol}://{section.ip}:{section.port}"
         self.ip = section.ip
         self.port = int(section.port)
+        # resolve the address once, rather than on every check of whether the server
+        # has started
+        self._sockaddr = socket.getaddrinfo(
+            self.ip, self.port, socket.AF_INET, socket.SOCK_STREAM
+        )[0][4]
         self.name = name
-        self.client = WebsocketClient(url=self.websocket_uri)
+        # every request to the node (including stopping it) goes through this pool. It
+        # belongs to this node alone, since the node controls the server's lifetime.
+        self.pool = NodePool(self.websocket_uri)
         self.config = config
         self.exe = exe
         self.command_log = command_log
         self.pid: Optional[int] = None
         self.process: Optional[subprocess.Popen[bytes]] = None
+        # the last server info fetched from the node, and when it was fetched (see
+        # `get_brief_server_info`)
+        self._cached_info: Optional[Dict[str, Any]] = None
+        self._cached_info_time = 0.0
         if self.command_log is not None:
             with open(self.command_log, "w") as f:
                 f.write("# Start \n")
@@ -63,8 +117,9 @@ class Node:
         return self.config.get_file_name()
 
     def shutdown(self: Node) -> None:
-        """Shut down the connection to the server."""
-        self.client.close()
+        """Shut down the connections to the server."""
+        self._cached_info = None
+        self.pool.close()
 
     @property
     def running(self: Node) -> bool:
@@ -96,25 +151,63 @@ class Node:
             The response from the node.
 
         Raises:
-            Exception: If the transaction fails.
+            XRPLRequestFailureException: If the request fails.
         """
-        response = self.client.request(req)
+        with self.pool.acquire() as client:
+            try:
+                response = client.request(req)
+            except XRPLWebsocketException:
+                if client.is_open():
+                    raise
+                # the connection was dropped (e.g. the server was restarted), so the
+                # request was refused before being sent. Reconnecting and sending it is
+                # safe even for requests with side effects (e.g. `ledger_accept`).
+                # Failures after the request was sent are never retried.
+                self.pool.reconnect(client)
+                response = client.request(req)
         if response.is_successful():
             return response.result
-        raise Exception("failed transaction", response.result)
+        raise XRPLRequestFailureException(response.result)
+
+    @staticmethod
+    def _is_filled(txn: Transaction) -> bool:
+        """
+        Determine whether a transaction already has all the fields that autofilling
+        would fill in (so autofilling it would be wasted work).
 
-    def sign_and_submit(self: Node, txn: Transaction, wallet: Wallet) -> Dict[str, Any]:
+        Args:
+            txn: The transaction to check.
+
+        Returns:
+            Whether the transaction's sequence, fee, and last ledger sequence are set.
+        """
+        return (
+            txn.sequence is not None
+            and txn.fee is not None
+            and txn.last_ledger_sequence is not None
+        )
+
+    def sign_and_submit(
+        self: Node, txn: Transaction, wallet: Wallet, *, wait: bool = True
+    ) -> Dict[str, Any]:
         """
         Sign and submit the given transaction.
 
         Args:
             txn: The transaction to send.
             wallet: The wallet to use to sign the transaction.
+            wait: Whether to wait for the transaction to be validated. A local node
+                never waits (standalone ledgers are closed with `ledger_accept`), so
+                this is ignored.
 
         Returns:
             The result from the server for the transaction's submission.
         """
-        return safe_sign_and_submit_transaction(txn, wallet, self.client).result
+        filled = self._is_filled(txn)
+        with self.pool.acquire() as client:
+            return safe_sign_and_submit_transaction(
+                txn, wallet, client, autofill=not filled, check_fee=not filled
+            ).result
 
     def start_server(
         self: Node,
@@ -149,18 +242,31 @@ class Node:
 
     def stop_server(self: Node, *, server_out: str = os.devnull) -> None:
         """
-        Stop the server.
+        Stop the server. The stop command is sent over the node's admin WebSocket
+        connection, rather than by running a second rippled process to send it. If the
+        server can't be reached, the process is terminated instead. The node's
+        connections to the server are closed once it has exited, and re-opened on their
+        next use if the server is restarted.
 
         Args:
             server_out: The log file for server information.
         """
-        to_run = [self.exe, "--conf", self.config_file_name]
-        fout = open(os.devnull, "w")
-        subprocess.Popen(to_run + ["stop"], stdout=fout, stderr=subprocess.STDOUT)
-
         assert self.process is not None
-        self.process.wait()
+        try:
+            with self.pool.acquire() as client:
+                client.request(GenericRequest(command="stop"))  # type: ignore
+        except (XRPLException, OSError):
+            self.process.terminate()
+
+        try:
+            self.process.wait(timeout=_SERVER_STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            print(f"Server {self.name} did not stop in time, killing it", flush=True)
+            self.process.kill()
+            self.process.wait()
         self.pid = None
+        self._cached_info = None
+        self.pool.close()
 
     def server_started(self: Node) -> bool:
         """
@@ -171,9 +277,81 @@ class Node:
             Whether the socket is open and ready to accept a WebSocket connection.
         """
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            result = sock.connect_ex((self.ip, self.port))
+            result = sock.connect_ex(self._sockaddr)
             return result == 0  # means the WS port is open for connections
 
+    def wait_for_server_start(
+        self: Node, timeout: float = SERVER_START_TIMEOUT
+    ) -> None:
+        """
+        Wait until the server is ready to accept a WebSocket connection on its port.
+        The port is polled with an exponential backoff, so a server that starts quickly
+        is noticed quickly, and a server process that exits while starting up is
+        reported immediately instead of after the timeout.
+
+        Args:
+            timeout: How long to wait, in seconds. The default is 10 seconds.
+
+        Raises:
+            Exception: If the server exits or takes too long to start.
+        """
+        deadline = time.monotonic() + timeout
+        delay = _SERVER_START_MIN_POLL
+        while not self.server_started():
+            if self.process is not None and self.process.poll() is not None:
+                raise Exception(
+                    f"Server {self.name} exited with code {self.process.returncode} "
+                    "while starting up."
+                )
+            if time.monotonic() >= deadline:
+                raise Exception(f"Timeout: server {self.name} took too long to start.")
+            time.sleep(delay)
+            delay = min(delay * 2, _SERVER_START_MAX_POLL)
+
+    def _server_info(self: Node, max_age: float = 0.0) -> Dict[str, Any]:
+        # Get the node's server info, reusing the last fetched info if it's less than
+        # `max_age` seconds old. Every fetch refreshes the cached info, so polling (e.g.
+        # while waiting for a server to sync) also keeps `get_brief_server_info` fresh.
+        # Returns an empty dict if the server isn't ready to answer yet (e.g. it's still
+        # loading).
+        now = time.monotonic()
+        if self._cached_info is not None and now - self._cached_info_time < max_age:
+            return self._cached_info
+        try:
+            info = self.request(ServerInfo()).get("info", {})
+        except XRPLRequestFailureException:
+            return {}
+        self._cached_info = info
+        self._cached_info_time = now
+        return info
+
+    def _poll_until(
+        self: Node,
+        predicate: Callable[[Dict[str, Any]], bool],
+        describe: Callable[[Dict[str, Any]], str],
+        timeout: float = _SYNC_TIMEOUT,
+    ) -> bool:
+        # Poll the node's server info until `predicate` holds for it, backing off
+        # geometrically between polls (a syncing server rarely changes state within a
+        # second, but a fast one shouldn't be held up by a long first sleep). Progress
+        # is printed every `_SYNC_REPORT_INTERVAL` seconds. Returns whether the
+        # predicate was satisfied before `timeout` seconds passed.
+        deadline = time.monotonic() + timeout
+        next_report = time.monotonic()
+        delay = _SYNC_MIN_POLL
+        while True:
+            info = self._server_info()
+            if predicate(info):
+                return True
+            now = time.monotonic()
+            if now >= deadline:
+                return False
+            if now >= next_report:
+                print(describe(info), flush=True)
+                next_report = now + _SYNC_REPORT_INTERVAL
+            time.sleep(min(delay, deadline - now))
+            delay = min(delay * _SYNC_POLL_BACKOFF, _SYNC_MAX_POLL)
+
     def wait_for_validated_ledger(self: Node) -> None:
         """
         Wait for the server to have validated ledgers.
@@ -181,40 +359,35 @@ class Node:
         Raises:
             ValueError: if the servers were unable to sync.
         """
-        for i in range(600):
-            r = self.request(ServerInfo())
-            state = None
-            if "info" in r:
-                state = r["info"]["server_state"]
-                if state == "proposing":
-                    print(f"Synced: {self.name} : {state}", flush=True)
-                    break
-            if not i % 10:
-                print(f"Waiting for sync: {self.name} : {state}", flush=True)
-            time.sleep(1)
-
-        for i in range(600):
-            r = self.request(ServerInfo())
-            state = None
-            if "info" in r:
-                complete_ledgers = r["info"]["complete_ledgers"]
-                if complete_ledgers and complete_ledgers != "empty":
-                    print(f"Have complete ledgers: {self.name} : {state}", flush=True)
-                    return
-            if not i % 10:
-                print(
-                    f"Waiting for complete_ledgers: {self.name} : "
-                    f"{complete_ledgers}",
-                    flush=True,
-                )
-            time.sleep(1)
+        if self._poll_until(
+            lambda info: info.get("server_state") in _SYNCED_STATES,
+            lambda info: f"Waiting for sync: {self.name} : "
+            f"{info.get('server_state')}",
+        ):
+            print(f"Synced: {self.name}", flush=True)
+
+        if self._poll_until(
+            lambda info: info.get("complete_ledgers", "empty") not in ("", "empty"),
+            lambda info: f"Waiting for complete_ledgers: {self.name} : "
+            f"{info.get('complete_ledgers')}",
+        ):
+            print(f"Have complete ledgers: {self.name}", flush=True)
+            return
 
         raise ValueError(f"Could not sync server {self.name}")
 
-    def get_brief_server_info(self: Node) -> Dict[str, Any]:
+    def get_brief_server_info(
+        self: Node, max_age: float = SERVER_INFO_TTL
+    ) -> Dict[str, Any]:
         """
         Get a dictionary of the server_state, validated_ledger_seq, and
-        complete_ledgers for the node.
+        complete_ledgers for the node. Server info fetched less than `max_age` seconds
+        ago is reused, so callers that refresh faster than ledgers close (e.g. a UI)
+        don't each cost a round trip.
+
+        Args:
+            max_age: How old the reused server info may be, in seconds. The default is
+                1 second. Pass 0 to always fetch fresh info.
 
         Returns:
             A dictionary of the server_state, validated_ledger_seq, and
@@ -223,13 +396,10 @@ class Node:
         ret = {"server_state": "", "ledger_seq": "", "complete_ledgers": ""}
         if not self.running:
             return ret
-        r = self.client.request(ServerInfo()).result
-        if "info" not in r:
-            return ret
-        r = r["info"]
+        info = self._server_info(max_age)
         for f in ["server_state", "complete_ledgers"]:
-            if f in r:
-                ret[f] = r[f]
-        if "validated_ledger" in r:
-            ret["ledger_seq"] = r["validated_ledger"]["seq"]
+            if f in info:
+                ret[f] = info[f]
+        if "validated_ledger" in info:
+            ret["ledger_seq"] = info["validated_ledger"]["seq"]
         return ret
@@ -0,0 +1,182 @@
+"""A pool of WebSocket connections to a single node."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from asyncio import run_coroutine_threadsafe
+from contextlib import contextmanager
+from queue import Queue
+from typing import Dict, Generator, List, Set, Type
+
+from xrpl.clients import WebsocketClient
+
+DEFAULT_POOL_SIZE = 4
+
+# websocket URI -> the pool shared by every node connected to that URI
+_SHARED_POOLS: Dict[str, NodePool] = {}
+_SHARED_POOLS_LOCK = threading.Lock()
+
+
+def close_client(client: WebsocketClient) -> None:
+    """
+    Close a WebSocket client, including one whose connection has already dropped (e.g.
+    because the server it was connected to exited). `WebsocketClient.close` does nothing
+    once the connection has dropped, which would leave the client's event loop thread
+    running. There is no public way to stop that thread, so this uses the client's
+    private attributes, and the xrpl-py version is pinned in pyproject.toml to the
+    releases it has been checked against.
+
+    Args:
+        client: The client to close.
+    """
+    if client.is_open():
+        client.close()
+        return
+    loop = client._loop
+    thread = client._thread
+    if loop is None or thread is None:
+        # the client was never opened, or has already been closed
+        return
+    if client._handler_task is not None:
+        # clean up what's left of the dropped connection
+        run_coroutine_threadsafe(client._do_close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+    client._loop = None
+    client._thread = None
+
+
+class NodePool:
+    """
+    A pool of WebSocket connections to a single node.
+
+    Requests lease a connection from the pool for the duration of one call, so that
+    concurrent requests to the same node don't queue up behind each other on a single
+    socket.
+    """
+
+    def __init__(
+        self: NodePool, websocket_uri: str, size: int = DEFAULT_POOL_SIZE
+    ) -> None:
+        """
+        Initialize a NodePool.
+
+        Args:
+            websocket_uri: The WebSocket URI of the node.
+            size: The number of connections in the pool. The default is 4.
+
+        Raises:
+            ValueError: If `size` is less than 1.
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, received {size}")
+        self.websocket_uri = websocket_uri
+        self._clients: List[WebsocketClient] = [
+            WebsocketClient(url=websocket_uri) for _ in range(size)
+        ]
+        self._idle: Queue[WebsocketClient] = Queue()
+        for client in self._clients:
+            self._idle.put(client)
+        # clients that have been opened, so that leasing a client doesn't need to probe
+        # the socket state every time
+        self._opened: Set[WebsocketClient] = set()
+        # guards `_opened`, which clients are added to from whichever threads lease them
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls: Type[NodePool], websocket_uri: str) -> NodePool:
+        """
+        Get the pool for a node, shared with every other user of the same WebSocket
+        URI. This lets chains that connect to the same node (e.g. repeated setups
+        against an external network) reuse already-open connections. Shared pools
+        stay open until the program exits, so a chain that connects after another
+        one has shut down still finds the connections open.
+
+        Args:
+            websocket_uri: The WebSocket URI of the node.
+
+        Returns:
+            The shared pool for the node.
+        """
+        with _SHARED_POOLS_LOCK:
+            pool = _SHARED_POOLS.get(websocket_uri)
+            if pool is None:
+                pool = cls(websocket_uri)
+                _SHARED_POOLS[websocket_uri] = pool
+            return pool
+
+    @property
+    def size(self: NodePool) -> int:
+        """
+        The number of connections in the pool.
+
+        Returns:
+            The number of connections in the pool.
+        """
+        return len(self._clients)
+
+    @contextmanager
+    def acquire(self: NodePool) -> Generator[WebsocketClient, None, None]:
+        """
+        Lease a connection from the pool, blocking until one is free. The connection
+        is opened on first use, since the node may not be running when the pool is
+        created.
+
+        Yields:
+            An open WebSocket client connected to the node.
+        """
+        client = self._idle.get()
+        try:
+            if client not in self._opened:
+                try:
+                    client.open()
+                except BaseException:
+                    # a failed open leaves the client's event loop thread running
+                    close_client(client)
+                    raise
+                with self._lock:
+                    self._opened.add(client)
+            yield client
+        finally:
+            self._idle.put(client)
+
+    def reconnect(self: NodePool, client: WebsocketClient) -> None:
+        """
+        Re-open a leased connection, e.g. after the server it was connected to was
+        restarted.
+
+        Args:
+            client: The leased client to re-open.
+        """
+        # the old connection has usually dropped by now, so tear it down without
+        # checking whether it's open, or its event loop thread would outlive it
+        close_client(client)
+        client.open()
+        with self._lock:
+            self._opened.add(client)
+
+    def close(self: NodePool) -> None:
+        """
+        Close all the connections in the pool, including ones whose server has exited.
+        The pool can still be used afterwards: connections are re-opened on their next
+        lease.
+        """
+        with self._lock:
+            opened = list(self._opened)
+            self._opened.clear()
+        for client in opened:
+            close_client(client)
+
+
+# close the shared pools' connections (see `NodePool.shared`)
+def _close_shared_pools() -> None:
+    with _SHARED_POOLS_LOCK:
+        pools = list(_SHARED_POOLS.values())
+        _SHARED_POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(_close_shared_pools)
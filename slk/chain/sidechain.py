@@ -1,18 +1,35 @@
 """Representation of a local sidechain."""
 from __future__ import annotations
 
-import glob
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Set, Union
 
 from xrpl.models import GenericRequest
 
 from slk.chain.chain import Chain
-from slk.chain.node import Node
+from slk.chain.node import SERVER_START_TIMEOUT, Node
 from slk.classes.config_file import ConfigFile
 
 
+# Delete all the files in a node's database directory (leaving the directories).
+# This walks the tree with `os.scandir`, whose entries cache their file type, so each
+# path is visited once without holding the whole listing in memory.
+def _clear_database(db_path: Optional[str]) -> None:
+    if db_path and os.path.isdir(db_path):
+        _remove_files(db_path)
+
+
+def _remove_files(dir_path: str) -> None:
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_files(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
 class Sidechain(Chain):
     """Representation of a local sidechain."""
 
@@ -67,14 +84,13 @@ class Sidechain(Chain):
 
         # remove the old database directories.
         # we want tests to start from the same empty state every time
-        for config in configs:
-            db_path = config.database_path.get_line()
-            if db_path and os.path.isdir(db_path):
-                files = glob.glob(f"{db_path}/**", recursive=True)
-                for f in files:
-                    if os.path.isdir(f):
-                        continue
-                    os.unlink(f)
+        with ThreadPoolExecutor(max_workers=max(1, len(configs))) as executor:
+            list(
+                executor.map(
+                    lambda config: _clear_database(config.database_path.get_line()),
+                    configs,
+                )
+            )
 
         node_num = 0
         for config, log in zip(configs, node_logs):
@@ -162,16 +178,14 @@ class Sidechain(Chain):
         """
         return [i in self.running_server_indexes for i in range(len(self.nodes))]
 
-    def _is_running(self: Sidechain, index: int) -> bool:
-        return index in self.running_server_indexes
-
     def shutdown(self: Sidechain) -> None:
         """Shut down the chain."""
+        # stop the servers first, since stopping them uses the nodes' connections
+        self.servers_stop()
+
         for node in self.nodes:
             node.shutdown()
 
-        self.servers_stop()
-
     def servers_start(
         self: Sidechain,
         *,
@@ -192,24 +206,31 @@ class Sidechain(Chain):
         if server_indexes is None:
             server_indexes = [i for i in range(len(self.nodes))]
 
-        for i in server_indexes:
-            if i in self.running_server_indexes or not self.run_server[i]:
-                continue
-
-            node = self.nodes[i]
-            node.start_server(server_out=server_out)
-            self.running_server_indexes.add(i)
-
-        # wait until the servers have started up
-        counter = 0
-        while not all([node.server_started() for node in self.nodes]):
-            counter += 1
-            if counter == 20:  # 10 second timeout
-                raise Exception("Timeout: servers took too long to start.")
-            time.sleep(0.5)
-
-        for node in self.nodes:
-            node.client.open()
+        to_start = [
+            i
+            for i in server_indexes
+            if i not in self.running_server_indexes and self.run_server[i]
+        ]
+        # spawn the servers concurrently, so that N servers don't take N times as long
+        # to launch
+        if to_start:
+            with ThreadPoolExecutor(max_workers=len(to_start)) as executor:
+                list(
+                    executor.map(
+                        lambda i: self.nodes[i].start_server(server_out=server_out),
+                        to_start,
+                    )
+                )
+            self.running_server_indexes.update(to_start)
+
+        # wait until the servers have started up. Only the servers this chain is running
+        # are waited on: servers that aren't run by this chain (see `run_server`) could
+        # start at any time, and servers that were stopped aren't going to start.
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        for i in sorted(self.running_server_indexes):
+            self.nodes[i].wait_for_server_start(
+                timeout=max(deadline - time.monotonic(), 0)
+            )
 
     def servers_stop(
         self: Sidechain, server_indexes: Optional[Union[Set[int], List[int]]] = None
@@ -224,12 +245,12 @@ class Sidechain(Chain):
         if server_indexes is None:
             server_indexes = self.running_server_indexes.copy()
 
-        for i in server_indexes:
-            if i not in self.running_server_indexes:
-                continue
-            node = self.nodes[i]
-            node.stop_server()
-            self.running_server_indexes.discard(i)
+        to_stop = [i for i in server_indexes if i in self.running_server_indexes]
+        # stop the servers concurrently, so that the shutdown grace periods overlap
+        if to_stop:
+            with ThreadPoolExecutor(max_workers=len(to_stop)) as executor:
+                list(executor.map(lambda i: self.nodes[i].stop_server(), to_stop))
+            self.running_server_indexes.difference_update(to_stop)
 
         if len(self.running_server_indexes) == 0:
             print(
@@ -251,10 +272,12 @@ class Sidechain(Chain):
             "ledger_seq": [],
             "complete_ledgers": [],
         }
-        for n in self.nodes:
-            r = n.get_brief_server_info()
-            for (k, v) in r.items():
-                ret[k].append(v)
+        # query the nodes concurrently, so this takes one round trip instead of one per
+        # node
+        with ThreadPoolExecutor(max_workers=max(1, len(self.nodes))) as executor:
+            for r in executor.map(lambda n: n.get_brief_server_info(), self.nodes):
+                for (k, v) in r.items():
+                    ret[k].append(v)
         return ret
 
     def federator_info(
@@ -270,19 +293,30 @@ class Sidechain(Chain):
         Returns:
             The federator info of the servers.
         """
-        # key is server index. value is federator_info result
-        result_dict = {}
+        running = self.running_server_indexes
         if server_indexes is None or len(server_indexes) == 0:
-            server_indexes = [i for i in range(len(self.nodes)) if self._is_running(i)]
-        for i in server_indexes:
-            if self._is_running(i):
-                result_dict[i] = self.get_node(i).request(
-                    GenericRequest(command="federator_info")  # type: ignore
-                )
-        return result_dict
+            indexes = sorted(running)
+        else:
+            indexes = [i for i in server_indexes if i in running]
+        if not indexes:
+            return {}
+        request = GenericRequest(command="federator_info")  # type: ignore
+        # query the servers concurrently, so this takes one round trip instead of one
+        # per server
+        with ThreadPoolExecutor(max_workers=len(indexes)) as executor:
+            results = executor.map(lambda i: self.get_node(i).request(request), indexes)
+            # key is server index. value is federator_info result
+            return dict(zip(indexes, results))
 
     def wait_for_validated_ledger(self: Sidechain) -> None:
         """Don't return until the network has at least one validated ledger."""
         print("")  # adds some spacing after the rippled startup messages
-        for i in range(len(self.nodes)):
-            self.nodes[i].wait_for_validated_ledger()
+        # the nodes sync at the same time, so wait on them concurrently (the total wait
+        # is the slowest node's, not the sum). Calling `result` re-raises any node's
+        # failure to sync.
+        with ThreadPoolExecutor(max_workers=max(1, len(self.nodes))) as executor:
+            futures = [
+                executor.submit(node.wait_for_validated_ledger) for node in self.nodes
+            ]
+            for future in futures:
+                future.result()
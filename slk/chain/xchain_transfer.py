@@ -1,14 +1,63 @@
 """Methods for running cross-chain transfers."""
 
 import time
+from functools import lru_cache
+from typing import Optional
 
-from xrpl.models import Amount, Memo, Payment
+from xrpl.clients import XRPLRequestFailureException
+from xrpl.models import AccountInfo, Amount, Memo, Payment
 
 from slk.chain.chain import Chain
 from slk.classes.account import Account
 from slk.launch.sidechain_params import SidechainParams
 
 
+# how long to wait for the federators to submit the other side of a transfer to a
+# standalone chain, in seconds
+_FEDERATOR_SUBMIT_TIMEOUT = 1.0
+_FEDERATOR_SUBMIT_MIN_POLL = 0.05
+
+
+# The memo that routes a cross-chain transfer to its destination. xrpl-py models are
+# immutable and validated when they're built, so the memo for a destination is built
+# once and reused for repeated transfers to it.
+@lru_cache(maxsize=64)
+def _memo_for(memo_data: str) -> Memo:
+    return Memo(memo_data=memo_data)
+
+
+# Get the sequence number of a chain's door account in the current (open) ledger.
+def _door_sequence(chain: Chain, door: Account) -> Optional[int]:
+    try:
+        result = chain.request(
+            AccountInfo(account=door.account_id, ledger_index="current")
+        )
+    except XRPLRequestFailureException:
+        return None
+    return int(result["account_data"]["Sequence"])
+
+
+# Wait until the federators have submitted a transaction from the door account to
+# the chain's open ledger, i.e. until the door account's sequence number has moved
+# past `start_sequence`. Gives up after `_FEDERATOR_SUBMIT_TIMEOUT` seconds (which is
+# also how long it waits if the starting sequence number isn't known).
+def _wait_for_door_transaction(
+    chain: Chain, door: Account, start_sequence: Optional[int]
+) -> None:
+    deadline = time.monotonic() + _FEDERATOR_SUBMIT_TIMEOUT
+    delay = _FEDERATOR_SUBMIT_MIN_POLL
+    while start_sequence is not None:
+        now = time.monotonic()
+        if now >= deadline:
+            return
+        time.sleep(min(delay, deadline - now))
+        delay *= 2
+        sequence = _door_sequence(chain, door)
+        if sequence is None or sequence > start_sequence:
+            return
+    time.sleep(_FEDERATOR_SUBMIT_TIMEOUT)
+
+
 def _xchain_transfer(
     from_chain: Chain,
     to_chain: Chain,
@@ -18,7 +67,10 @@ def _xchain_transfer(
     from_chain_door: Account,
     to_chain_door: Account,
 ) -> None:
-    memo = Memo(memo_data=dst.account_id_str_as_hex())
+    memo = _memo_for(dst.account_id_str_as_hex())
+    start_sequence = (
+        _door_sequence(to_chain, to_chain_door) if to_chain.standalone else None
+    )
     from_chain.send_signed(
         Payment(
             account=src.account_id,
@@ -30,8 +82,9 @@ def _xchain_transfer(
     from_chain.maybe_ledger_accept()
     if to_chain.standalone:
         # from_chain (side chain) sends a txn, but won't close the to_chain (main chain)
-        # ledger
-        time.sleep(1)
+        # ledger. Wait for the federators' transaction to reach the to_chain's open
+        # ledger (rather than always waiting a full second) and then close it.
+        _wait_for_door_transaction(to_chain, to_chain_door, start_sequence)
         to_chain.maybe_ledger_accept()
 
 
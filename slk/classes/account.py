@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
-import binascii
-from typing import Any, Type
+from functools import lru_cache
+from typing import Any, Optional, Type
 
 from xrpl.wallet import Wallet
 
 
+# Deriving a wallet's keys from its seed is expensive, and the same seeds (e.g. the
+# door and genesis accounts) get turned into accounts repeatedly, so derive each
+# seed's wallet once.
+@lru_cache(maxsize=1024)
+def _wallet_from_seed(seed: str) -> Wallet:
+    return Wallet(seed, 0)
+
+
 class Account:
     """Representation of an account in the XRPL."""
 
+    __slots__ = ("account_id", "nickname", "seed", "_wallet", "_account_id_hex")
+
     def __init__(self: Account, *, account_id: str, nickname: str, seed: str) -> None:
         """
         Initialize an account.
@@ -26,7 +36,23 @@ class Account:
         self.nickname = nickname
         self.seed = seed
 
-        self.wallet = Wallet(seed, 0)
+        # the wallet is derived on first use (see `wallet`), since many accounts (e.g.
+        # door accounts that are only referenced by address) never sign anything
+        self._wallet: Optional[Wallet] = None
+        # cached result of `account_id_str_as_hex`
+        self._account_id_hex: Optional[str] = None
+
+    @property
+    def wallet(self: Account) -> Wallet:
+        """
+        The wallet for the account, derived from its seed the first time it's used.
+
+        Returns:
+            The wallet for the account.
+        """
+        if self._wallet is None:
+            self._wallet = _wallet_from_seed(self.seed)
+        return self._wallet
 
     @classmethod
     def from_seed(cls: Type[Account], name: str, seed: str) -> Account:
@@ -40,7 +66,7 @@ class Account:
         Returns:
             The Account that corresponds to the provided information.
         """
-        wallet = Wallet(seed, 0)
+        wallet = _wallet_from_seed(seed)
 
         return Account(
             account_id=wallet.classic_address,
@@ -100,6 +126,16 @@ class Account:
         """
         return not self == lhs
 
+    def __hash__(self: Account) -> int:
+        """
+        Returns the hash of an Account, consistent with `__eq__` (so accounts can be
+        used in sets and as dictionary keys).
+
+        Returns:
+            The hash of the account ID.
+        """
+        return hash(self.account_id)
+
     def __str__(self: Account) -> str:
         """
         Get a string representation of an Account.
@@ -118,4 +154,7 @@ class Account:
         Returns:
             The account ID in hex form.
         """
-        return binascii.hexlify(self.account_id.encode()).decode("utf-8")
+        if self._account_id_hex is None:
+            # classic addresses are base58, so they're always ASCII
+            self._account_id_hex = self.account_id.encode("ascii").hex()
+        return self._account_id_hex
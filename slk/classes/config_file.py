@@ -2,7 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Type
+import re
+import sys
+from typing import Any, Dict, List, Optional
+
+
+# Matches each non-blank, non-comment line of a config file (ignoring surrounding
+# whitespace), capturing either a section name ("[name]") or the line itself. This lets
+# the whole file be scanned in one pass, instead of a Python-level loop over its lines.
+_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:\[(?P<section>.+)\]|(?P<line>[^#\s].*?))[^\S\n]*$", re.MULTILINE
+)
 
 
 class _Section:
@@ -15,20 +25,9 @@ class _Section:
     section_key_2=value_2
     """
 
-    @classmethod
-    def section_header(cls: Type[_Section], line: str) -> Optional[str]:
-        """
-        If the line is a section header, return the section name. Otherwise return None.
-
-        Args:
-            line: The line of the section.
-
-        Returns:
-            The section name, if it exists. Else, none.
-        """
-        if line.startswith("[") and line.endswith("]"):
-            return line[1:-1]
-        return None
+    # the key-value pairs are exposed as attributes through `__getattr__`, so the
+    # section's own attributes are slots, which are found without a `__dict__` lookup
+    __slots__ = ("_name", "_lines", "_kv_pairs")
 
     def __init__(self: _Section, name: str) -> None:
         """
@@ -37,20 +36,20 @@ class _Section:
         Args:
             name: The name of the section.
         """
-        self._set_init(True)
         self._name = name
         # lines contains all non key-value pairs
         self._lines: List[str] = []
         self._kv_pairs: Dict[str, str] = {}
-        self._set_init(False)
 
     def get_name(self: _Section) -> str:
         return self._name
 
     def add_line(self: _Section, line: str) -> None:
-        s = line.split("=")
-        if len(s) == 2:
-            self._kv_pairs[s[0].strip()] = s[1].strip()
+        # only lines with exactly one "=" are key-value pairs
+        key, sep, value = line.partition("=")
+        if sep and "=" not in value:
+            # the same keys show up in every node's config file, so share one copy
+            self._kv_pairs[sys.intern(key.strip())] = value.strip()
         else:
             self._lines.append(line)
 
@@ -63,14 +62,11 @@ class _Section:
         return None
 
     def __getstate__(self: _Section) -> Dict[str, Any]:
-        return vars(self)
+        return {name: getattr(self, name) for name in _Section.__slots__}
 
     def __setstate__(self: _Section, state: Dict[str, Any]) -> None:
-        vars(self).update(state)
-
-    def _set_init(self: _Section, value: bool) -> None:
-        # turn on/off "init" mode
-        super().__setattr__("init", value)
+        for (name, value) in state.items():
+            object.__setattr__(self, name, value)
 
     def __getattr__(self: _Section, name: str) -> str:
         try:
@@ -79,7 +75,9 @@ class _Section:
             raise AttributeError(name)
 
     def __setattr__(self: _Section, name: str, value: str) -> None:
-        if self.init or name in self.__dict__:
+        # the section's own attributes are stored normally, and anything else is a
+        # key-value pair
+        if name in _Section.__slots__:
             super().__setattr__(name, value)
         else:
             self._kv_pairs[name] = value
@@ -104,21 +102,21 @@ class ConfigFile:
 
         cur_section = None
         with open(file_name) as f:
-            for n, line in enumerate(f):
-                line = line.strip()
-                if line.startswith("#") or not line:
-                    continue
-                if section_name := _Section.section_header(line):
-                    if cur_section:
-                        self._add_section(cur_section)
-                    cur_section = _Section(section_name)
-                    continue
-                if not cur_section:
-                    raise ValueError(
-                        f"Error parsing config file: {file_name} "
-                        f"line_num: {n} line: {line}"
-                    )
-                cur_section.add_line(line)
+            text = f.read()
+        for match in _LINE_RE.finditer(text):
+            if section_name := match.group("section"):
+                if cur_section:
+                    self._add_section(cur_section)
+                cur_section = _Section(sys.intern(section_name))
+                continue
+            line = match.group("line")
+            if not cur_section:
+                n = text.count("\n", 0, match.start("line"))
+                raise ValueError(
+                    f"Error parsing config file: {file_name} "
+                    f"line_num: {n} line: {line}"
+                )
+            cur_section.add_line(line)
 
         if cur_section:
             self._add_section(cur_section)
@@ -3,15 +3,10 @@
 from __future__ import annotations
 
 import argparse
-import os
 
-from dotenv import dotenv_values
 from xrpl.wallet import Wallet
 
-_ENV_VARS = {
-    **os.environ,
-    **{key: value for key, value in dotenv_values().items() if value},
-}
+from slk.utils.env_vars import get_env_vars
 
 
 def _parse_args() -> argparse.Namespace:
@@ -101,62 +96,45 @@ class ConfigParams:
             Exception: if the arguments provided are invalid.
         """
         args = _parse_args()
+        env_vars = get_env_vars()
 
-        if "RIPPLED_SIDECHAIN_CFG_DIR" in _ENV_VARS:
-            self.configs_dir = _ENV_VARS["RIPPLED_SIDECHAIN_CFG_DIR"]
-        if args.cfgs_dir:
-            self.configs_dir = args.cfgs_dir
-        # if `self.configs_dir` doesn't exist (done this way for typing purposes)
-        if not hasattr(self, "configs_dir"):
+        configs_dir = args.cfgs_dir or env_vars.get("RIPPLED_SIDECHAIN_CFG_DIR")
+        if configs_dir is None:
             raise Exception(
                 "Missing configs directory location. Either set the env variable "
                 "RIPPLED_SIDECHAIN_CFG_DIR or use the --cfgs_dir command line switch"
             )
+        self.configs_dir = configs_dir
 
-        if "NUM_FEDERATORS" in _ENV_VARS:
-            self.num_federators = int(_ENV_VARS["NUM_FEDERATORS"])
-        if args.num_federators:
-            self.num_federators = int(args.num_federators)
-        # if `self.num_federators` doesn't exist (done this way for typing purposes)
-        if not hasattr(self, "num_federators"):
+        num_federators = args.num_federators or env_vars.get("NUM_FEDERATORS")
+        if num_federators is None:
             raise Exception(
                 "Missing configs directory location. Either set the env variable "
                 "NUM_FEDERATORS or use the --num_federators command line switch"
             )
+        self.num_federators = int(num_federators)
         if self.num_federators < 1 or self.num_federators > 8:
             raise Exception(
                 "Invalid number of federators. Expected between 1 and 8 "
                 f"(inclusive), received {self.num_federators}"
             )
 
-        mainnet = None
-        if "MAINNET" in _ENV_VARS:
-            mainnet = _ENV_VARS["MAINNET"]
-        if args.mainnet:
-            mainnet = args.mainnet
-        if not mainnet:
-            mainnet = "standalone"
+        mainnet = args.mainnet or env_vars.get("MAINNET") or "standalone"
         self.mainnet_url = "127.0.0.1" if mainnet == "standalone" else mainnet
         self.standalone = mainnet == "standalone" or mainnet == "127.0.0.1"
 
         self.mainnet_port = None
         if not self.standalone:
-            if "MAINNET_PORT" in _ENV_VARS:
-                self.mainnet_port = int(_ENV_VARS["MAINNET_PORT"])
-            if args.mainnet_port:
-                self.mainnet_port = int(args.mainnet_port)
+            mainnet_port = args.mainnet_port or env_vars.get("MAINNET_PORT")
+            if mainnet_port:
+                self.mainnet_port = int(mainnet_port)
 
-        self.door_seed = None
-        if "DOOR_ACCOUNT_SEED" in _ENV_VARS:
-            self.door_seed = _ENV_VARS["DOOR_ACCOUNT_SEED"]
-        if args.door_seed:
-            self.door_seed = args.door_seed
+        self.door_seed = args.door_seed or env_vars.get("DOOR_ACCOUNT_SEED")
 
         self.xchain_assets = args.assets or []
 
         self.issuer = None
         if not self.standalone:
-            if "IOU_ISSUER" in _ENV_VARS:
-                self.issuer = Wallet(_ENV_VARS["IOU_ISSUER"], 0)
-            if args.iou_issuer:
-                self.issuer = Wallet(args.iou_issuer, 0)
+            issuer_seed = args.iou_issuer or env_vars.get("IOU_ISSUER")
+            if issuer_seed:
+                self.issuer = Wallet(issuer_seed, 0)
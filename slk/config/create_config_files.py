@@ -32,7 +32,11 @@ from slk.config.helper_classes import Ports, XChainAsset
 from slk.config.network import SidechainNetwork, StandaloneNetwork
 from slk.utils.eprint import eprint
 
-JINJA_ENV = Environment(loader=FileSystemLoader(searchpath="./slk/config/templates"))
+# the templates don't change while the script runs, so don't re-stat them on every
+# lookup to check whether they need reloading
+JINJA_ENV = Environment(
+    loader=FileSystemLoader(searchpath="./slk/config/templates"), auto_reload=False
+)
 
 NODE_SIZE = "medium"
 
@@ -97,6 +101,10 @@ def _generate_cfg_dirs_sidechain(
     sidenet: SidechainNetwork,
     xchain_assets: Dict[str, XChainAsset],
 ) -> None:
+    # each node's ports stanza is also an entry in the fixed ips list, so serialize the
+    # ports once and share the dicts between the two
+    fixed_ips = [p.to_dict() for p in sidenet.ports]
+
     # data that isn't node-specific
     initial_template_data = {
         "full_history": full_history,
@@ -109,7 +117,7 @@ def _generate_cfg_dirs_sidechain(
         ],
         "federators": sidenet.federator_keypairs,
         # other
-        "fixed_ips": [p.to_dict() for p in sidenet.ports],
+        "fixed_ips": fixed_ips,
         "node_size": NODE_SIZE,
         "with_shards": with_shards,
     }
@@ -122,7 +130,6 @@ def _generate_cfg_dirs_sidechain(
             Path(sub_dir + path).mkdir(parents=True, exist_ok=True)
 
         validator_kp = sidenet.validator_keypairs[fed_num]
-        ports = sidenet.ports[fed_num]
         validation_seed = validator_kp.secret_key
         validators = [kp.public_key for kp in sidenet.validator_keypairs]
 
@@ -130,7 +137,7 @@ def _generate_cfg_dirs_sidechain(
             **initial_template_data,
             "sub_dir": sub_dir,
             # ports stanza
-            "ports": ports.to_dict(),
+            "ports": fixed_ips[fed_num],
             # sidechains-specific stanzas
             "signing_key": sidenet.federator_keypairs[fed_num].secret_key,
             "mainchain_port_ws": mainnet_ws_port,
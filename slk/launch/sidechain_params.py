@@ -3,20 +3,14 @@
 from __future__ import annotations
 
 import argparse
-import os
 from typing import Optional
 
-from dotenv import dotenv_values
 from xrpl.core.addresscodec import decode_account_public_key
 from xrpl.core.keypairs import derive_classic_address
 
 from slk.classes.account import Account
 from slk.classes.config_file import ConfigFile
-
-_ENV_VARS = {
-    **os.environ,
-    **{key: value for key, value in dotenv_values().items() if value},
-}
+from slk.utils.env_vars import get_env_vars
 
 
 def _parse_args_helper(parser: argparse.ArgumentParser) -> None:
@@ -139,6 +133,7 @@ class SidechainParams:
             Exception: if the arguments provided are invalid.
         """
         args = _parse_args()
+        env_vars = get_env_vars()
 
         # set up debug params
         self.debug_sidechain = False
@@ -162,8 +157,8 @@ class SidechainParams:
 
         # identify network to connect to
         mainnet = None
-        if "MAINNET" in _ENV_VARS:
-            mainnet = _ENV_VARS["MAINNET"]
+        if "MAINNET" in env_vars:
+            mainnet = env_vars["MAINNET"]
         if args.mainnet:
             mainnet = args.mainnet
         if not mainnet:
@@ -173,19 +168,19 @@ class SidechainParams:
 
         self.mainnet_port = None
         if not self.main_standalone:
-            if "MAINNET_PORT" in _ENV_VARS:
-                self.mainnet_port = int(_ENV_VARS["MAINNET_PORT"])
+            if "MAINNET_PORT" in env_vars:
+                self.mainnet_port = int(env_vars["MAINNET_PORT"])
             if args.mainnet_port:
                 self.mainnet_port = int(args.mainnet_port)
 
-            if "IOU_ISSUER" in _ENV_VARS:
-                self.issuer = _ENV_VARS["IOU_ISSUER"]
+            if "IOU_ISSUER" in env_vars:
+                self.issuer = env_vars["IOU_ISSUER"]
             # TODO: add cli arg
 
         if self.main_standalone:
             # identify mainchain rippled exe file location (for standalone)
-            if "RIPPLED_MAINCHAIN_EXE" in _ENV_VARS:
-                self.mainchain_exe = _ENV_VARS["RIPPLED_MAINCHAIN_EXE"]
+            if "RIPPLED_MAINCHAIN_EXE" in env_vars:
+                self.mainchain_exe = env_vars["RIPPLED_MAINCHAIN_EXE"]
             if args.exe_mainchain:
                 self.mainchain_exe = args.exe_mainchain
             # if `self.mainchain_exe` doesn't exist (done this way for typing purposes)
@@ -197,8 +192,8 @@ class SidechainParams:
                 )
 
         # identify sidechain rippled exe file location
-        if "RIPPLED_SIDECHAIN_EXE" in _ENV_VARS:
-            self.sidechain_exe = _ENV_VARS["RIPPLED_SIDECHAIN_EXE"]
+        if "RIPPLED_SIDECHAIN_EXE" in env_vars:
+            self.sidechain_exe = env_vars["RIPPLED_SIDECHAIN_EXE"]
         if args.exe_sidechain:
             self.sidechain_exe = args.exe_sidechain
         # if `self.sidechain_exe` doesn't exist (done this way for typing purposes)
@@ -210,8 +205,8 @@ class SidechainParams:
 
         # identify where all the config files are located
         self.configs_dir = None
-        if "RIPPLED_SIDECHAIN_CFG_DIR" in _ENV_VARS:
-            self.configs_dir = _ENV_VARS["RIPPLED_SIDECHAIN_CFG_DIR"]
+        if "RIPPLED_SIDECHAIN_CFG_DIR" in env_vars:
+            self.configs_dir = env_vars["RIPPLED_SIDECHAIN_CFG_DIR"]
         if args.cfgs_dir:
             self.configs_dir = args.cfgs_dir
         if configs_dir is not None:
@@ -246,8 +241,8 @@ class SidechainParams:
 
         # set up door account
         door_seed = None
-        if "DOOR_ACCOUNT_SEED" in _ENV_VARS:
-            door_seed = _ENV_VARS["DOOR_ACCOUNT_SEED"]
+        if "DOOR_ACCOUNT_SEED" in env_vars:
+            door_seed = env_vars["DOOR_ACCOUNT_SEED"]
         if args.door_seed:
             door_seed = args.door_seed
         if door_seed is None:
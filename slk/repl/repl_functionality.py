@@ -2,6 +2,7 @@
 
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, cast
 
 from xrpl.models import XRP, Currency, IssuedCurrency, Memo, Payment, TrustSet, is_xrp
@@ -189,31 +190,29 @@ def set_up_ious(mc_chain: Chain, sc_chain: Chain) -> None:
         sc_chain: The sidechain.
     """
     # TODO: refactor all of these to use `alias_to_account_id`
-    mc_asset = IssuedCurrency(
-        currency="USD", issuer=mc_chain.account_from_alias("root").account_id
-    )
-    sc_asset = IssuedCurrency(
-        currency="USD", issuer=sc_chain.account_from_alias("door").account_id
-    )
+    mc_root = mc_chain.account_from_alias("root").account_id
+    mc_alice = mc_chain.account_from_alias("alice").account_id
+    mc_door = mc_chain.account_from_alias("door").account_id
+    sc_brad = sc_chain.account_from_alias("brad")
+    sc_door = sc_chain.account_from_alias("door").account_id
+
+    mc_asset = IssuedCurrency(currency="USD", issuer=mc_root)
+    sc_asset = IssuedCurrency(currency="USD", issuer=sc_door)
     mc_chain.add_asset_alias(mc_asset, "rrr")
     sc_chain.add_asset_alias(sc_asset, "ddd")
     mc_chain.send_signed(
         TrustSet(
-            account=mc_chain.account_from_alias("alice").account_id,
+            account=mc_alice,
             limit_amount=mc_asset.to_amount(1_000_000),
         )
     )
 
     # create brad account on the side chain and set the trust line
-    memos = [
-        Memo.from_dict(
-            {"MemoData": sc_chain.account_from_alias("brad").account_id_str_as_hex()}
-        )
-    ]
+    memos = [Memo.from_dict({"MemoData": sc_brad.account_id_str_as_hex()})]
     mc_chain.send_signed(
         Payment(
-            account=mc_chain.account_from_alias("alice").account_id,
-            destination=mc_chain.account_from_alias("door").account_id,
+            account=mc_alice,
+            destination=mc_door,
             amount=str(3000 * 1_000_000),
             memos=memos,
         )
@@ -223,15 +222,15 @@ def set_up_ious(mc_chain: Chain, sc_chain: Chain) -> None:
     # create a trust line to alice and pay her USD/rrr
     mc_chain.send_signed(
         TrustSet(
-            account=mc_chain.account_from_alias("alice").account_id,
+            account=mc_alice,
             limit_amount=mc_asset.to_amount(1_000_000),
         )
     )
     mc_chain.maybe_ledger_accept()
     mc_chain.send_signed(
         Payment(
-            account=mc_chain.account_from_alias("root").account_id,
-            destination=mc_chain.account_from_alias("alice").account_id,
+            account=mc_root,
+            destination=mc_alice,
             amount=mc_asset.to_amount(10_000),
         )
     )
@@ -242,7 +241,7 @@ def set_up_ious(mc_chain: Chain, sc_chain: Chain) -> None:
     # create a trust line for brad
     sc_chain.send_signed(
         TrustSet(
-            account=sc_chain.account_from_alias("brad").account_id,
+            account=sc_brad.account_id,
             limit_amount=sc_asset.to_amount(1_000_000),
         )
     )
@@ -299,9 +298,27 @@ def get_balances_data(
             for c in chains
         ]
 
-    result = []
+    # collect every (chain, account, asset) lookup first, so that they can all be sent
+    # to the nodes in one concurrent wave
+    lookups: List[Tuple[Chain, str, Account, Currency]] = []
     for chain, chain_name, acc, asset in zip(chains, chain_names, account_ids, assets):
-        chain_result = chain.get_balances(acc, asset)
+        chain_short_name = "main" if chain_name == "mainchain" else "side"
+        accounts = chain.known_accounts() if acc is None else [acc]
+        lookups += [
+            (chain, chain_short_name, account, currency)
+            for account in accounts
+            for currency in asset
+        ]
+
+    with ThreadPoolExecutor() as executor:
+        chain_results = list(
+            executor.map(
+                lambda lookup: lookup[0].get_balances(lookup[2], lookup[3]), lookups
+            )
+        )
+
+    result = []
+    for (chain, chain_short_name, _, _), chain_result in zip(lookups, chain_results):
         for chain_res in chain_result:
             chain.substitute_nicknames(chain_res)
             if not in_drops and chain_res["currency"] == "XRP":
@@ -314,7 +331,6 @@ def get_balances_data(
                     chain_res["balance"] = int(chain_res["balance"])
                 except ValueError:
                     chain_res["balance"] = float(chain_res["balance"])
-            chain_short_name = "main" if chain_name == "mainchain" else "side"
             chain_res["account"] = chain_short_name + " " + chain_res["account"]
         result += chain_result
     return result
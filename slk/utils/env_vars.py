@@ -0,0 +1,24 @@
+"""Reading the environment variables that configure the Sidechain Launch Kit."""
+
+import os
+from functools import lru_cache
+from typing import Dict
+
+from dotenv import dotenv_values
+
+
+# read on first use rather than at import, so importing a module that uses this doesn't
+# touch the filesystem looking for a `.env` file
+@lru_cache(maxsize=1)
+def get_env_vars() -> Dict[str, str]:
+    """
+    Get the environment variables, along with the ones set in a `.env` file (which
+    take precedence). A variable that is set to an empty value, in either place, is
+    treated as unset and left out.
+
+    Returns:
+        The non-empty environment variables, by name.
+    """
+    env_vars = {key: value for key, value in os.environ.items() if value}
+    env_vars.update((key, value) for key, value in dotenv_values().items() if value)
+    return env_vars
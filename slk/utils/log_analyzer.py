@@ -4,6 +4,7 @@ from __future__ import annotations
 import argparse
 import json
 import re
+from typing import List
 
 from slk.utils.eprint import eprint
 
@@ -114,7 +115,10 @@ def convert_log(
         Exception: if something goes wrong (?).
     """
     try:
-        prev_lines = None
+        # the lines of the log entry being read (a log entry can span several lines).
+        # They're collected in a list and joined once the entry is complete, rather
+        # than concatenated one by one.
+        prev_lines: List[str] = []
         with open(in_file_name) as input:
             with open(out_file_name, "w") as out:
                 for line in input:
@@ -123,20 +127,20 @@ def convert_log(
                         continue
                     if LogLine.UNSTRUCTURED_RE.match(line):
                         if prev_lines:
-                            log_line = LogLine(prev_lines)
+                            log_line = LogLine(" ".join(prev_lines))
                             if log_line.module == "SidechainFederator":
                                 if pure_json:
                                     print(log_line.to_pure_json(), file=out)
                                 else:
                                     print(log_line.to_mixed_json(), file=out)
-                        prev_lines = line
+                        prev_lines = [line]
                     else:
                         if not prev_lines:
                             eprint(f"Error: Expected prev_lines. Cur line: {line}")
                         assert prev_lines
-                        prev_lines += f" {line}"
+                        prev_lines.append(line)
                 if prev_lines:
-                    log_line = LogLine(prev_lines)
+                    log_line = LogLine(" ".join(prev_lines))
                     if log_line.module == "SidechainFederator":
                         if pure_json:
                             print(log_line.to_pure_json(), file=out, flush=True)